@@ -0,0 +1,273 @@
+"""Validate and compile the article library.
+
+Checks every .j2 file under articles/ for Jinja syntax errors and the
+{# resolution #} / {# confluence link #} comment convention, reports
+English/French parity gaps and articles missing from Issue-codes.csv, then
+writes articles/catalog.json for the app to load.
+
+Results are cached by content hash so only changed files are re-checked:
+
+    python compile_articles.py
+    python compile_articles.py --jobs 8 --no-cache
+"""
+import sys
+import os
+import re
+import csv
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from jinja2 import Environment, TemplateSyntaxError
+
+CACHE_VERSION = 2
+CATALOG_VERSION = 1
+ARTICLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "articles")
+CATALOG_NAME = "catalog.json"
+CACHE_NAME = ".article-cache.json"
+CODES_NAME = "Issue-codes.csv"
+FRENCH_DIR = "french"
+TEMPLATES_DIR = "templates"
+# Below this many changed files a process pool costs more than it saves
+POOL_THRESHOLD = 64
+
+_env = None
+
+
+def parse_article(text):
+    # Same split the app uses: first comment is the resolution, last comment is the confluence link
+    comments = re.findall(r"\{#(.*?)#\}", text, re.DOTALL)
+    steps = re.sub(r"\{#.*?#\}", "", text, flags=re.DOTALL).strip()
+    resolution = comments[0].strip() if comments else ""
+    confluence_link = ""
+    if comments and comments[-1].strip().startswith("http"):
+        confluence_link = comments[-1].strip()
+    return comments, steps, resolution, confluence_link
+
+
+def check_article(rel_path, data):
+    global _env
+    if _env is None:
+        _env = Environment()
+    # The app opens articles with strict utf-8, so undecodable files are reported and kept out of the catalog
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        return {"problems": [f"byte {e.start}: not valid UTF-8 ({e.reason})"]}
+    problems = []
+    try:
+        _env.parse(text)
+    except TemplateSyntaxError as e:
+        problems.append(f"line {e.lineno}: template syntax error: {e.message}")
+
+    result = {"problems": problems}
+    if rel_path.split("/", 1)[0] == TEMPLATES_DIR:
+        return result
+
+    comments, steps, resolution, confluence_link = parse_article(text)
+    if text.count("{#") != text.count("#}"):
+        problems.append("unbalanced {# #} comment markers")
+    if any("{#" in c for c in comments):
+        problems.append("nested {# inside a comment")
+    if len(comments) != 2:
+        problems.append(f"expected 2 comments (resolution, confluence link), found {len(comments)}")
+    if comments and not comments[0].strip().startswith("-"):
+        problems.append("first comment should be the resolution, starting with '-'")
+    if not confluence_link:
+        problems.append("last comment should be the confluence link (http...)")
+    if not steps:
+        problems.append("no troubleshooting steps outside the comments")
+
+    result.update(steps=steps, resolution=resolution, confluence_link=confluence_link)
+    return result
+
+
+def _check_item(item):
+    return check_article(*item)
+
+
+def scan_articles(root):
+    found = {}
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".j2"):
+                    rel_path = os.path.relpath(entry.path, root).replace(os.sep, "/")
+                    found[rel_path] = entry
+    return found
+
+
+def load_issue_codes(path):
+    code_map = {}
+    try:
+        with open(path, newline='', encoding='utf-8') as csvfile:
+            for row in csv.reader(csvfile):
+                if len(row) >= 2:
+                    code_map[row[0].strip().lower()] = row[1].strip()
+    except OSError as e:
+        print(f"Failed to load issue code mapping: {e}", file=sys.stderr)
+    return code_map
+
+
+def load_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def cross_check(results, code_map):
+    problems = []
+    english = {}
+    french = {}
+    for rel_path in results:
+        top = rel_path.split("/", 1)[0]
+        if top == TEMPLATES_DIR:
+            continue
+        if top == FRENCH_DIR:
+            french[rel_path.split("/", 1)[1]] = rel_path
+        else:
+            english[rel_path] = rel_path
+
+    for key in sorted(english.keys() - french.keys()):
+        problems.append((key, f"no French version at {FRENCH_DIR}/{key}"))
+    for key in sorted(french.keys() - english.keys()):
+        problems.append((french[key], f"no English version at {key}"))
+    for key in sorted(english.keys() & french.keys()):
+        en_link = results[key].get("confluence_link")
+        fr_link = results[french[key]].get("confluence_link")
+        if en_link and fr_link and en_link != fr_link:
+            problems.append((key, f"confluence link differs from {FRENCH_DIR}/{key}"))
+
+    article_names = set()
+    for rel_path in list(english.values()) + list(french.values()):
+        name = rel_path.rsplit("/", 1)[-1].lower()
+        article_names.add(name)
+        if name not in code_map:
+            problems.append((rel_path, f"no issue code in {CODES_NAME}"))
+    for name in sorted(code_map.keys() - article_names):
+        problems.append((CODES_NAME, f"issue code for {name} has no article"))
+    return problems
+
+
+def build_catalog(results, code_map):
+    articles = {}
+    for rel_path in sorted(results):
+        result = results[rel_path]
+        if "steps" not in result:
+            continue
+        articles[rel_path] = {
+            "issue_code": code_map.get(rel_path.rsplit("/", 1)[-1].lower(), ""),
+            "steps": result["steps"],
+            "resolution": result["resolution"],
+            "confluence_link": result["confluence_link"],
+        }
+    return {"version": CATALOG_VERSION, "articles": articles}
+
+
+def _catalog_record(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return {"path": path, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def compile_articles(root=ARTICLES_DIR, jobs=None, use_cache=True, catalog_path=None):
+    cache_path = os.path.join(root, CACHE_NAME)
+    catalog_path = catalog_path or os.path.join(root, CATALOG_NAME)
+    cache = load_json(cache_path) if use_cache else None
+    if not cache or cache.get("version") != CACHE_VERSION:
+        cache = {"version": CACHE_VERSION, "codes_sha256": "", "files": {}}
+    cached_files = cache["files"]
+
+    codes_path = os.path.join(root, CODES_NAME)
+    try:
+        with open(codes_path, "rb") as f:
+            codes_sha256 = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        codes_sha256 = ""
+    code_map = load_issue_codes(codes_path)
+
+    files = {}
+    todo = []
+    for rel_path, entry in scan_articles(root).items():
+        st = entry.stat()
+        cached = cached_files.get(rel_path)
+        if cached and cached["size"] == st.st_size and cached["mtime_ns"] == st.st_mtime_ns:
+            files[rel_path] = cached
+            continue
+        with open(entry.path, "rb") as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        record = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+        if cached and cached["sha256"] == digest:
+            record["result"] = cached["result"]
+        else:
+            todo.append((rel_path, data))
+        files[rel_path] = record
+
+    if todo:
+        if jobs != 1 and len(todo) >= POOL_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                checked = list(pool.map(_check_item, todo, chunksize=max(1, len(todo) // 64)))
+        else:
+            checked = [check_article(*item) for item in todo]
+        for (rel_path, _), result in zip(todo, checked):
+            files[rel_path]["result"] = result
+
+    results = {rel_path: record["result"] for rel_path, record in files.items()}
+    problems = [(rel_path, p) for rel_path in sorted(results) for p in results[rel_path]["problems"]]
+    problems += cross_check(results, code_map)
+
+    # The cache records which catalog file it built; rebuild whenever that file isn't the one on disk
+    catalog_path = os.path.abspath(catalog_path)
+    catalog_record = cache.get("catalog")
+    changed = bool(todo) or files.keys() != cached_files.keys() or codes_sha256 != cache["codes_sha256"]
+    if changed or catalog_record != _catalog_record(catalog_path):
+        write_json(catalog_path, build_catalog(results, code_map))
+        catalog_record = _catalog_record(catalog_path)
+    # Written after the catalog so an interrupted run is redone next time
+    if catalog_record != cache.get("catalog") or files != cached_files or codes_sha256 != cache["codes_sha256"]:
+        cache["files"] = files
+        cache["codes_sha256"] = codes_sha256
+        cache["catalog"] = catalog_record
+        write_json(cache_path, cache)
+
+    return {"total": len(files), "checked": len(todo), "problems": problems, "catalog": catalog_path}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate the article library and compile the app catalog.")
+    parser.add_argument("--articles", default=ARTICLES_DIR, help="articles folder (default: %(default)s)")
+    parser.add_argument("--catalog", default=None, help="catalog output path (default: <articles>/catalog.json)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="re-check every file")
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    report = compile_articles(args.articles, jobs=args.jobs, use_cache=not args.no_cache, catalog_path=args.catalog)
+    for rel_path, problem in report["problems"]:
+        print(f"{rel_path}: {problem}")
+    print(
+        f"{report['total']} files, {report['checked']} re-checked, "
+        f"{len(report['problems'])} problem(s); catalog: {report['catalog']}"
+    )
+    return 1 if report["problems"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,11 +2,16 @@ import sys
 import os
 import datetime
 import csv
+import json
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QPushButton, QComboBox, QStackedWidget, QTextEdit, QLineEdit, QHBoxLayout, QSpinBox, QTextBrowser, QMessageBox
 )
 from PyQt6.QtCore import Qt, QSize, QUrl
-from PyQt6.QtMultimedia import QSoundEffect
+try:
+    from PyQt6.QtMultimedia import QSoundEffect
+except ImportError:
+    # QtMultimedia needs system audio libraries (e.g. libpulse); run silently without them
+    QSoundEffect = None
 from PyQt6.QtGui import QPixmap, QMovie
 from jinja2 import Environment, FileSystemLoader
 
@@ -14,6 +19,7 @@ class TroubleshooterApp(QWidget):
     def __init__(self):
         super().__init__()
         self.issue_code_map = self.load_issue_code_map()
+        self.article_catalog, self.article_catalog_mtime = self.load_article_catalog()
         self.setWindowTitle("SM9 Ticket Generator")
         self.setMinimumSize(400, 350)
         self.setStyleSheet("""
@@ -40,12 +46,13 @@ class TroubleshooterApp(QWidget):
             }
         """)
         # Sound effect setup
-        self.button_sound = QSoundEffect()
-        try:
-            self.button_sound.setSource(QUrl.fromLocalFile("buttonsound.wav"))
-        except Exception:
-            pass
-        self.button_sound.setVolume(0.5)
+        self.button_sound = QSoundEffect() if QSoundEffect else None
+        if self.button_sound:
+            try:
+                self.button_sound.setSource(QUrl.fromLocalFile("buttonsound.wav"))
+            except Exception:
+                pass
+            self.button_sound.setVolume(0.5)
 
         self.layout = QVBoxLayout(self)
         # Title section at the top
@@ -86,6 +93,8 @@ class TroubleshooterApp(QWidget):
         self.layout.addLayout(footer_layout)
 
     def play_button_sound(self):
+        if not self.button_sound:
+            return
         if self.button_sound.isLoaded():
             self.button_sound.play()
         else:
@@ -386,7 +395,16 @@ class TroubleshooterApp(QWidget):
         steps_text = ""
         resolution_text = ""
         confluence_link = ""
-        if os.path.exists(issue_file):
+        # Prefer the compiled catalog (compile_articles.py) unless the article was edited after it was built
+        catalog_key = os.path.relpath(issue_file, os.path.join(base_path, "articles")).replace(os.sep, "/")
+        catalog_entry = self.article_catalog.get(catalog_key)
+        if catalog_entry and os.path.exists(issue_file) and os.path.getmtime(issue_file) > self.article_catalog_mtime:
+            catalog_entry = None
+        if catalog_entry:
+            steps_text = catalog_entry.get("steps", "")
+            resolution_text = catalog_entry.get("resolution", "")
+            confluence_link = catalog_entry.get("confluence_link", "")
+        elif os.path.exists(issue_file):
             with open(issue_file, "r", encoding="utf-8") as f:
                 article_text = f.read()
             import re
@@ -615,6 +633,18 @@ class TroubleshooterApp(QWidget):
             print(f"Failed to load issue code mapping: {e}")
         return code_map
 
+    def load_article_catalog(self):
+        catalog_file = os.path.join(os.path.dirname(__file__), "articles", "catalog.json")
+        if not os.path.exists(catalog_file):
+            return {}, 0
+        try:
+            with open(catalog_file, encoding='utf-8') as f:
+                catalog = json.load(f)
+            return catalog.get("articles", {}), os.path.getmtime(catalog_file)
+        except Exception as e:
+            print(f"Failed to load article catalog: {e}")
+        return {}, 0
+
     def handle_issue_not_listed(self, event=None):
         self.selected_issue = "Issue Not Listed"
         self.selected_issue_code = ""
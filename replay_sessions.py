@@ -0,0 +1,278 @@
+"""Replay recorded agent sessions against TroubleshooterApp and measure responsiveness.
+
+Each session in sessions/*.json is a list of steps that drive the real widgets
+(combo boxes, line edits and buttons, found by their text on the current page).
+For every step the harness records:
+
+    tti      time from the action starting until the event loop has an idle
+             tick with nothing left to paint (time-to-interactive)
+    frame    the longest gap between event loop heartbeats (longest blocked frame)
+    stall    total time spent in gaps longer than one frame budget
+
+and fails the run when any of them exceeds its threshold. A step still running
+after timeout_ms (typically stuck in a modal dialog) has the dialog closed and
+is failed, unless it is marked "expect_blocked". Runs headless:
+
+    QT_QPA_PLATFORM=offscreen python replay_sessions.py
+    python replay_sessions.py sessions/english-laptop-wifi.json --max-tti-ms 150
+"""
+import sys
+import os
+import glob
+import json
+import argparse
+from time import perf_counter
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QPushButton, QMessageBox
+from PyQt6.QtCore import Qt, QObject, QEvent, QEventLoop, QTimer
+
+from main import TroubleshooterApp
+
+SESSIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sessions")
+DEFAULT_THRESHOLDS = {
+    "frame_budget_ms": 16.0,
+    "max_frame_ms": 50.0,
+    "max_stall_ms": 100.0,
+    "max_tti_ms": 200.0,
+    "timeout_ms": 5000.0,
+}
+
+
+class FrameMonitor(QObject):
+    # Heartbeat timer plus an app-wide paint counter; gaps between ticks are blocked time
+    def __init__(self):
+        super().__init__()
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(1)
+        self.timer.timeout.connect(self.tick)
+        self.paints = 0
+        self.last_tick = None
+        self.gaps = []
+        self.waiter = None
+        QApplication.instance().installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            self.paints += 1
+        return False
+
+    def start(self):
+        self.last_tick = perf_counter()
+        self.gaps = []
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        QApplication.instance().removeEventFilter(self)
+
+    def tick(self):
+        now = perf_counter()
+        self.gaps.append(now - self.last_tick)
+        self.last_tick = now
+        if self.waiter:
+            self.waiter(now)
+
+
+def find_button(window, text):
+    page = window.stacked.currentWidget()
+    for btn in page.findChildren(QPushButton):
+        if btn.text() == text and btn.isVisible() and btn.isEnabled():
+            return btn
+    available = [btn.text() for btn in page.findChildren(QPushButton) if btn.isVisible()]
+    raise LookupError(f"no '{text}' button on page {window.stacked.currentIndex()} (have: {', '.join(available)})")
+
+
+def describe_step(step):
+    if "select" in step:
+        return f"select {step['select']} = {step['text']}"
+    if "type" in step:
+        return f"type {step['type']}"
+    if "click" in step:
+        return f"click {step['click']}"
+    if "new_ticket" in step:
+        return "new ticket"
+    return json.dumps(step)
+
+
+def perform_step(window, step):
+    if "select" in step:
+        combo = getattr(window, step["select"])
+        index = combo.findText(step["text"])
+        if index == -1:
+            raise LookupError(f"{step['select']} has no item '{step['text']}'")
+        combo.setCurrentIndex(index)
+    elif "type" in step:
+        field = getattr(window, step["type"])
+        field.clear()
+        field.insert(step["text"])
+    elif "click" in step:
+        find_button(window, step["click"]).click()
+    elif "new_ticket" in step:
+        # Answer the "Start New Ticket" confirmation; the app then calls clear_all_fields()
+        question = QMessageBox.question
+        QMessageBox.question = lambda *args, **kwargs: QMessageBox.StandardButton.Yes
+        try:
+            find_button(window, "New Ticket").click()
+        finally:
+            QMessageBox.question = question
+    else:
+        raise ValueError(f"unknown step {step!r}")
+
+
+def measure(monitor, action, thresholds):
+    # Run action from inside the event loop and wait for the first quiet tick after it returns
+    loop = QEventLoop()
+    state = {"error": None, "tti": None, "blocked": None, "timed_out": False}
+
+    def wait_for_idle(now):
+        if monitor.paints == state["paints"]:
+            state["tti"] = now - state["start"]
+            loop.quit()
+        else:
+            state["paints"] = monitor.paints
+
+    def expire():
+        # Runs inside any nested loop the action started, e.g. a modal dialog's exec()
+        state["timed_out"] = True
+        monitor.waiter = None
+        modal = QApplication.activeModalWidget()
+        if modal:
+            state["blocked"] = modal.windowTitle() or type(modal).__name__
+            modal.close()
+        loop.quit()
+
+    def fire():
+        state["start"] = perf_counter()
+        watchdog.start()
+        try:
+            action()
+        except Exception as e:
+            state["error"] = e
+            loop.quit()
+            return
+        if not state["timed_out"]:
+            state["paints"] = -1
+            monitor.waiter = wait_for_idle
+
+    watchdog = QTimer()
+    watchdog.setSingleShot(True)
+    watchdog.setInterval(int(thresholds["timeout_ms"]))
+    watchdog.timeout.connect(expire)
+    # Only count time inside this loop, not the harness's work since the last step
+    monitor.gaps = []
+    monitor.last_tick = perf_counter()
+    QTimer.singleShot(0, fire)
+    loop.exec()
+    watchdog.stop()
+    monitor.waiter = None
+
+    budget = thresholds["frame_budget_ms"] / 1000
+    gaps = monitor.gaps
+    return {
+        "error": state["error"],
+        "blocked": state["blocked"],
+        "tti_ms": state["tti"] * 1000 if state["tti"] is not None else None,
+        "frame_ms": max(gaps, default=0) * 1000,
+        "stall_ms": sum(gap for gap in gaps if gap > budget) * 1000,
+    }
+
+
+def check_thresholds(result, thresholds):
+    failures = []
+    if result["error"] is not None:
+        failures.append(str(result["error"]))
+    if result["blocked"] is not None:
+        failures.append(f"blocked by modal '{result['blocked']}'")
+    if result["tti_ms"] is None:
+        if result["error"] is None:
+            failures.append(f"not interactive within {thresholds['timeout_ms']:.0f} ms")
+    elif result["tti_ms"] > thresholds["max_tti_ms"]:
+        failures.append(f"tti {result['tti_ms']:.1f} > {thresholds['max_tti_ms']:.0f} ms")
+    if result["frame_ms"] > thresholds["max_frame_ms"]:
+        failures.append(f"frame {result['frame_ms']:.1f} > {thresholds['max_frame_ms']:.0f} ms")
+    if result["stall_ms"] > thresholds["max_stall_ms"]:
+        failures.append(f"stall {result['stall_ms']:.1f} > {thresholds['max_stall_ms']:.0f} ms")
+    return failures
+
+
+def replay_session(session, thresholds):
+    thresholds = dict(thresholds, **session.get("thresholds", {}))
+    window = TroubleshooterApp()
+    window.show()
+    monitor = FrameMonitor()
+    monitor.start()
+    # Let the first show/paint settle so it is not charged to step 1
+    measure(monitor, lambda: None, thresholds)
+
+    results = []
+    try:
+        for step in session["steps"]:
+            before = window.stacked.currentIndex()
+            result = measure(monitor, lambda: perform_step(window, step), thresholds)
+            result["step"] = describe_step(step)
+            result["page"] = f"{before}->{window.stacked.currentIndex()}"
+            result["failures"] = check_thresholds(result, thresholds)
+            if step.get("expect_blocked"):
+                # The step is recorded to open a modal; passing means the watchdog caught and closed it
+                if result["blocked"] is None:
+                    result["failures"].append("expected a modal dialog to block")
+                else:
+                    result["failures"] = [f for f in result["failures"] if not f.startswith(("blocked by", "not interactive"))]
+            if "expect_page" in step and window.stacked.currentIndex() != step["expect_page"]:
+                result["failures"].append(f"expected page {step['expect_page']}, on {window.stacked.currentIndex()}")
+            results.append(result)
+            if result["error"] is not None:
+                break
+    finally:
+        monitor.stop()
+        # hide() rather than close() so the exit confirmation is not shown
+        window.hide()
+        window.deleteLater()
+    return results
+
+
+def load_sessions(paths):
+    if not paths:
+        paths = sorted(glob.glob(os.path.join(SESSIONS_DIR, "*.json")))
+    sessions = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            session = json.load(f)
+        session.setdefault("name", os.path.splitext(os.path.basename(path))[0])
+        sessions.append(session)
+    return sessions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay recorded sessions headlessly and check UI responsiveness.")
+    parser.add_argument("sessions", nargs="*", help="session files (default: sessions/*.json)")
+    parser.add_argument("--frame-budget-ms", type=float, default=DEFAULT_THRESHOLDS["frame_budget_ms"])
+    parser.add_argument("--max-frame-ms", type=float, default=DEFAULT_THRESHOLDS["max_frame_ms"])
+    parser.add_argument("--max-stall-ms", type=float, default=DEFAULT_THRESHOLDS["max_stall_ms"])
+    parser.add_argument("--max-tti-ms", type=float, default=DEFAULT_THRESHOLDS["max_tti_ms"])
+    parser.add_argument("--timeout-ms", type=float, default=DEFAULT_THRESHOLDS["timeout_ms"])
+    args = parser.parse_args(argv)
+    thresholds = {key: getattr(args, key) for key in DEFAULT_THRESHOLDS}
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    failed = 0
+    for session in load_sessions(args.sessions):
+        print(f"== {session['name']}")
+        for result in replay_session(session, thresholds):
+            tti = f"{result['tti_ms']:7.1f}" if result["tti_ms"] is not None else "    n/a"
+            status = "FAIL " + "; ".join(result["failures"]) if result["failures"] else "ok"
+            print(
+                f"  {result['step']:<40} {result['page']:>5}  tti {tti} ms  "
+                f"frame {result['frame_ms']:6.1f} ms  stall {result['stall_ms']:6.1f} ms  {status}"
+            )
+            failed += bool(result["failures"])
+    app.processEvents()
+    print(f"{failed} step(s) failed" if failed else "all steps within thresholds")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())